@@ -19,17 +19,46 @@ Does NOT remove (to prevent breaking other apps):
 Usage:
     python3 cleanup.py                  # Interactive mode with resource listing
     python3 cleanup.py --all            # Skip confirmations
+    python3 cleanup.py --all --skip-listing  # Go straight to deletion (CI/automation)
     python3 cleanup.py --dry-run        # Show what would be deleted
     python3 cleanup.py --verbose        # Show all commands
+    python3 cleanup.py --parallel       # Run independent cleanup phases concurrently
+                                        # (each phase's output is printed as one block when it finishes)
+
+Colors are only used when stdout is a terminal; set NO_COLOR to disable them.
+
+Exit codes:
+    0  Success (or nothing to clean up)
+    1  Unexpected error or interrupted
+    2  Invalid command line (reported by argparse)
+    3  kubectl or helm is not installed
+    4  kubectl cannot connect to the cluster
+
+If the kubernetes Python client is installed (pip install kubernetes), resource
+lookups and deletes go through the API over one persistent connection and
+namespace deletion is tracked with a watch; otherwise kubectl is used.
 """
 
+import os
+import shutil
+import signal
 import subprocess
 import sys
 import time
+import json
 import argparse
-from typing import List, Tuple, Optional
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    from kubernetes import client, config, watch
+    from kubernetes.client.rest import ApiException
+except ImportError:  # Optional dependency, kubectl is used instead
+    client = None
+
 
 @dataclass
 class Resource:
@@ -39,57 +68,129 @@ class Resource:
     namespace: str
 
 
+@dataclass
+class ApiEndpoint:
+    """Kubernetes API calls for a single object"""
+    read: Callable
+    delete: Callable
+    list_fn: Callable
+    list_args: tuple
+
+
+# Custom resources reached through CustomObjectsApi: kind -> (group, version, plural)
+CUSTOM_RESOURCES = {
+    'application': ('argoproj.io', 'v1alpha1', 'applications'),
+    'servicemonitor': ('monitoring.coreos.com', 'v1', 'servicemonitors'),
+    'prometheusrule': ('monitoring.coreos.com', 'v1', 'prometheusrules'),
+}
+
+
+def _ansi(code: str) -> str:
+    """Return the escape code, or nothing when output is piped or NO_COLOR is set"""
+    return code if sys.stdout.isatty() and not os.environ.get('NO_COLOR') else ''
+
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2  # argparse's own exit code for bad arguments, kept distinct from the rest
+EXIT_MISSING_TOOL = 3
+EXIT_NO_CLUSTER = 4
+
+# Upper bound for a single kubectl read so a hung API server cannot stall the run
+KUBECTL_REQUEST_TIMEOUT = '10s'
+
+
 class Colors:
     """ANSI color codes"""
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+    RED = _ansi('\033[91m')
+    GREEN = _ansi('\033[92m')
+    YELLOW = _ansi('\033[93m')
+    BLUE = _ansi('\033[94m')
+    CYAN = _ansi('\033[96m')
+    RESET = _ansi('\033[0m')
+    BOLD = _ansi('\033[1m')
 
 
 class QuakeWatchCleanup:
     """Main cleanup class"""
 
+    # Message templates, built once at class load
+    _RULE = f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}"
+    _HEADER_FMT = f"\n{_RULE}\n{Colors.BOLD}{Colors.CYAN}{{}}{Colors.RESET}\n{_RULE}\n"
+    _SUCCESS_FMT = f"{Colors.GREEN}✅ {{}}{Colors.RESET}"
+    _ERROR_FMT = f"{Colors.RED}❌ {{}}{Colors.RESET}"
+    _WARNING_FMT = f"{Colors.YELLOW}⚠️  {{}}{Colors.RESET}"
+    _INFO_FMT = f"{Colors.BLUE}ℹ️  {{}}{Colors.RESET}"
+
     def __init__(self, args):
         self.args = args
         self.deleted_resources = []
+        # (type, name, namespace) already deleted this run, so repeat deletes are skipped
+        self._deleted_keys: Set[Tuple[str, str, Optional[str]]] = set()
         self.verbose = args.verbose
         self.dry_run = args.dry_run
+        # Cluster state cache: (namespace, kind) -> names, filled by _get_many
+        self._cluster_state: Dict[Tuple[str, str], Set[str]] = {}
+        # Memoized answers for the lifetime of the run
+        self._ns_cache: Dict[str, bool] = {}
+        self._helm_releases: Dict[str, Set[str]] = {}  # namespace -> release names
+        # Probes are independent kubectl/helm calls, so they can run side by side
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        # Kubernetes API clients, loaded on first use by _api_endpoint()
+        self._v1 = None
+        self._custom = None
+        self._k8s_loaded = False
+        self._k8s_lock = threading.Lock()
+        # Per-thread output buffer, set while a phase runs under --parallel
+        self._out = threading.local()
+        self._out_lock = threading.Lock()
 
     # ==================== Helper Methods ====================
 
+    def _emit(self, text: str = ""):
+        """Print text, or hold it in the current phase's buffer when phases run in parallel"""
+        lines = getattr(self._out, 'lines', None)
+        if lines is None:
+            print(text)
+        else:
+            lines.append(text)
+
     def print_header(self, message: str):
         """Print formatted header"""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{message}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}\n")
+        self._emit(self._HEADER_FMT.format(message))
 
     def print_success(self, message: str):
         """Print success message"""
-        print(f"{Colors.GREEN}✅ {message}{Colors.RESET}")
+        self._emit(self._SUCCESS_FMT.format(message))
 
     def print_error(self, message: str):
         """Print error message"""
-        print(f"{Colors.RED}❌ {message}{Colors.RESET}")
+        self._emit(self._ERROR_FMT.format(message))
 
     def print_warning(self, message: str):
         """Print warning message"""
-        print(f"{Colors.YELLOW}⚠️  {message}{Colors.RESET}")
+        self._emit(self._WARNING_FMT.format(message))
 
     def print_info(self, message: str):
         """Print info message"""
-        print(f"{Colors.BLUE}ℹ️  {message}{Colors.RESET}")
+        self._emit(self._INFO_FMT.format(message))
+
+    def _prepare_command(self, cmd: List[str]) -> List[str]:
+        """Add a request timeout to kubectl reads unless the caller set one"""
+        if (cmd[0] == 'kubectl' and len(cmd) > 1 and cmd[1] in ['get', 'cluster-info']
+                and not any(arg.startswith('--request-timeout') for arg in cmd)):
+            return cmd + [f'--request-timeout={KUBECTL_REQUEST_TIMEOUT}']
+        return cmd
 
     def run_command(self, cmd: List[str], capture_output: bool = True) -> Tuple[int, str, str]:
         """Run command and return exit code, stdout, stderr"""
+        cmd = self._prepare_command(cmd)
         if self.verbose:
-            print(f"{Colors.CYAN}> {' '.join(cmd)}{Colors.RESET}")
+            self._emit(f"{Colors.CYAN}> {' '.join(cmd)}{Colors.RESET}")
 
         if self.dry_run and cmd[0] in ['kubectl', 'helm'] and any(x in cmd for x in ['delete', 'uninstall']):
-            print(f"{Colors.YELLOW}[DRY-RUN] Would execute: {' '.join(cmd)}{Colors.RESET}")
+            self._emit(f"{Colors.YELLOW}[DRY-RUN] Would execute: {' '.join(cmd)}{Colors.RESET}")
             return 0, "", ""
 
         try:
@@ -98,6 +199,17 @@ class QuakeWatchCleanup:
         except Exception as e:
             return 1, "", str(e)
 
+    def _run_exitcode(self, cmd: List[str]) -> int:
+        """Run a probe that only needs the exit code, discarding its output"""
+        cmd = self._prepare_command(cmd)
+        if self.verbose:
+            self._emit(f"{Colors.CYAN}> {' '.join(cmd)}{Colors.RESET}")
+
+        try:
+            return subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception:
+            return 1
+
     def confirm_action(self, message: str, default: bool = False) -> bool:
         """Ask user for confirmation"""
         if self.args.all:
@@ -107,52 +219,199 @@ class QuakeWatchCleanup:
         response = input(prompt).strip().lower()
         return response in ['y', 'yes'] if response else default
 
+    def _get_many(self, namespace: Optional[str], kinds: List[str]) -> Set[Tuple[str, str]]:
+        """List several resource kinds in one kubectl call and cache the (kind, name) pairs"""
+        # -o name prints only "kind[.group]/name" lines: far less output than -o json, no parsing
+        cmd = ['kubectl', 'get', ','.join(kinds), '-o', 'name', '--ignore-not-found']
+        if namespace:
+            cmd.extend(['-n', namespace])
+        returncode, stdout, _ = self.run_command(cmd)
+
+        if returncode != 0:
+            # One unknown kind (e.g. CRD not installed) fails the whole call, so retry per kind
+            if len(kinds) > 1:
+                found = set()
+                for kind in kinds:
+                    found |= self._get_many(namespace, [kind])
+                return found
+            return set()
+
+        found = set()
+        for line in stdout.split():
+            kind_group, _, name = line.partition('/')
+            found.add((kind_group.split('.')[0], name))
+        for kind in kinds:
+            self._cluster_state[(namespace or '', kind)] = {n for k, n in found if k == kind}
+        return found
+
+    def _forget(self, resource_type: str, name: str, namespace: Optional[str] = None):
+        """Drop a deleted resource from the cluster state cache"""
+        self._cluster_state.get((namespace or '', resource_type), set()).discard(name)
+
     def namespace_exists(self, namespace: str) -> bool:
         """Check if namespace exists"""
-        returncode, _, _ = self.run_command(['kubectl', 'get', 'namespace', namespace])
-        return returncode == 0
+        if namespace not in self._ns_cache:
+            self._ns_cache[namespace] = self.resource_exists('namespace', namespace)
+        return self._ns_cache[namespace]
 
     def resource_exists(self, resource_type: str, name: str, namespace: Optional[str] = None) -> bool:
         """Check if resource exists"""
+        cached = self._cluster_state.get((namespace or '', resource_type))
+        if cached is not None:
+            return name in cached
+
+        endpoint = self._api_endpoint(resource_type, name, namespace)
+        if endpoint is not None:
+            self._log_api('get', resource_type, name, namespace)
+            try:
+                endpoint.read()
+                return True
+            except ApiException as e:
+                return e.status != 404
+            except Exception:
+                return False
+
         cmd = ['kubectl', 'get', resource_type, name]
         if namespace:
             cmd.extend(['-n', namespace])
-        returncode, _, _ = self.run_command(cmd)
-        return returncode == 0
+        return self._run_exitcode(cmd) == 0
 
     def helm_release_exists(self, release: str, namespace: str) -> bool:
         """Check if Helm release exists"""
-        returncode, stdout, _ = self.run_command(['helm', 'list', '-n', namespace, '-q'])
-        return returncode == 0 and release in stdout
+        if namespace not in self._helm_releases:
+            # One helm call per namespace, matched exactly rather than by substring. Scoped to the
+            # namespace so helm's default --max 256 page cannot leave the release out on a busy cluster
+            returncode, stdout, _ = self.run_command(['helm', 'list', '-n', namespace, '-o', 'json'])
+            releases = json.loads(stdout) if returncode == 0 and stdout.strip() else []
+            self._helm_releases[namespace] = {r['name'] for r in releases}
+        return release in self._helm_releases[namespace]
 
     def delete_resource(self, resource_type: str, name: str, namespace: Optional[str] = None, wait: bool = False) -> bool:
         """Delete a Kubernetes resource"""
-        cmd = ['kubectl', 'delete', resource_type, name, '--ignore-not-found=true']
-        if namespace:
-            cmd.extend(['-n', namespace])
-        if wait:
-            cmd.append('--wait=true')
+        key = (resource_type, name, namespace)
+        if key in self._deleted_keys:
+            return True
 
-        returncode, _, stderr = self.run_command(cmd)
+        endpoint = None if self.dry_run else self._api_endpoint(resource_type, name, namespace)
+        if endpoint is not None:
+            self._log_api('delete', resource_type, name, namespace)
+            returncode, stderr = self._api_delete(endpoint, name, wait)
+        else:
+            cmd = ['kubectl', 'delete', resource_type, name, '--ignore-not-found=true']
+            if namespace:
+                cmd.extend(['-n', namespace])
+            if wait:
+                # Foreground cascade removes dependents before the owner object
+                cmd.extend(['--wait=true', '--cascade=foreground'])
+            returncode, _, stderr = self.run_command(cmd)
 
         if returncode == 0:
             self.deleted_resources.append(f"{resource_type}/{name}" + (f" -n {namespace}" if namespace else ""))
+            self._forget(resource_type, name, namespace)
+            self._deleted_keys.add(key)
             return True
         else:
             if stderr and self.verbose:
                 self.print_error(f"Failed to delete {resource_type}/{name}: {stderr}")
             return False
 
+    def _load_api(self) -> bool:
+        """Load kubeconfig and create the API clients once; False if kubectl should be used"""
+        with self._k8s_lock:
+            if not self._k8s_loaded:
+                self._k8s_loaded = True
+                if client is not None:
+                    try:
+                        config.load_kube_config()
+                    except Exception:
+                        try:
+                            config.load_incluster_config()
+                        except Exception:
+                            return False
+                    api_client = client.ApiClient()
+                    self._v1 = client.CoreV1Api(api_client)
+                    self._custom = client.CustomObjectsApi(api_client)
+            return self._v1 is not None
+
+    def _api_endpoint(self, resource_type: str, name: str, namespace: Optional[str] = None) -> Optional[ApiEndpoint]:
+        """Map a resource to typed API calls, or None if the kind is only reachable with kubectl"""
+        if not self._load_api():
+            return None
+
+        if resource_type == 'namespace':
+            return ApiEndpoint(
+                read=lambda: self._v1.read_namespace(name),
+                delete=lambda **kw: self._v1.delete_namespace(name, **kw),
+                list_fn=self._v1.list_namespace, list_args=())
+        if resource_type == 'configmap' and namespace:
+            return ApiEndpoint(
+                read=lambda: self._v1.read_namespaced_config_map(name, namespace),
+                delete=lambda **kw: self._v1.delete_namespaced_config_map(name, namespace, **kw),
+                list_fn=self._v1.list_namespaced_config_map, list_args=(namespace,))
+        if resource_type in CUSTOM_RESOURCES and namespace:
+            group, version, plural = CUSTOM_RESOURCES[resource_type]
+            return ApiEndpoint(
+                read=lambda: self._custom.get_namespaced_custom_object(group, version, namespace, plural, name),
+                delete=lambda **kw: self._custom.delete_namespaced_custom_object(
+                    group, version, namespace, plural, name, **kw),
+                list_fn=self._custom.list_namespaced_custom_object,
+                list_args=(group, version, namespace, plural))
+        return None
+
+    def _log_api(self, verb: str, resource_type: str, name: str, namespace: Optional[str] = None):
+        """Echo an API call in verbose mode, mirroring run_command"""
+        if self.verbose:
+            self._emit(f"{Colors.CYAN}> [API] {verb} {resource_type}/{name}"
+                       + (f" -n {namespace}" if namespace else "") + Colors.RESET)
+
+    def _api_delete(self, endpoint: ApiEndpoint, name: str, wait: bool, timeout: int = 120) -> Tuple[int, str]:
+        """Delete through the API; with wait, block on a watch until the object is gone"""
+        try:
+            endpoint.delete(body=client.V1DeleteOptions(propagation_policy='Foreground' if wait else None))
+            if not wait:
+                return 0, ""
+
+            # List first so the watch starts from a known resourceVersion and cannot miss DELETED
+            selector = f'metadata.name={name}'
+            current = endpoint.list_fn(*endpoint.list_args, field_selector=selector)
+            if isinstance(current, dict):  # CustomObjectsApi returns plain dicts
+                items, resource_version = current['items'], current['metadata']['resourceVersion']
+            else:
+                items, resource_version = current.items, current.metadata.resource_version
+            if not items:
+                return 0, ""
+
+            w = watch.Watch()
+            for event in w.stream(endpoint.list_fn, *endpoint.list_args, field_selector=selector,
+                                  resource_version=resource_version, timeout_seconds=timeout):
+                if event['type'] == 'DELETED':
+                    w.stop()
+                    return 0, ""
+            return 1, f"timed out after {timeout}s"
+        except ApiException as e:
+            if e.status == 404:
+                return 0, ""
+            return 1, str(e.reason)
+        except Exception as e:
+            return 1, str(e)
+
     def delete_namespace_wait(self, namespace: str, timeout: int = 120) -> bool:
         """Delete namespace and wait for completion"""
         if not self.namespace_exists(namespace):
             return True
 
-        cmd = ['kubectl', 'delete', 'namespace', namespace, f'--timeout={timeout}s']
-        returncode, _, stderr = self.run_command(cmd, capture_output=True)
+        endpoint = None if self.dry_run else self._api_endpoint('namespace', namespace)
+        if endpoint is not None:
+            self._log_api('delete', 'namespace', namespace)
+            returncode, stderr = self._api_delete(endpoint, namespace, wait=True, timeout=timeout)
+        else:
+            cmd = ['kubectl', 'delete', 'namespace', namespace, f'--timeout={timeout}s']
+            returncode, _, stderr = self.run_command(cmd, capture_output=True)
 
         if returncode == 0:
             self.deleted_resources.append(f"namespace/{namespace}")
+            self._forget('namespace', namespace)
+            self._ns_cache.pop(namespace, None)
             return True
         else:
             if self.verbose:
@@ -161,8 +420,8 @@ class QuakeWatchCleanup:
 
     # ==================== Prerequisite Checks ====================
 
-    def check_prerequisites(self) -> bool:
-        """Verify required tools are installed"""
+    def check_prerequisites(self) -> int:
+        """Verify required tools are installed, return EXIT_OK or the exit code to stop with"""
         self.print_header("Checking Prerequisites")
 
         tools = [
@@ -170,24 +429,39 @@ class QuakeWatchCleanup:
             ('helm', 'helm version')
         ]
 
+        # PATH lookup first: no point forking version checks or waiting on the cluster without the tools
+        missing = [tool for tool, _ in tools if shutil.which(tool) is None]
+        if missing:
+            for tool, _ in tools:
+                if tool in missing:
+                    self.print_error(f"{tool} is not installed")
+                else:
+                    self.print_success(f"{tool} is installed")
+            return EXIT_MISSING_TOOL
+
+        # Run the version checks and the connectivity check concurrently
+        tool_jobs = [(tool, self._pool.submit(self._run_exitcode, version_cmd.split()))
+                     for tool, version_cmd in tools]
+        cluster_job = self._pool.submit(self._run_exitcode, ['kubectl', 'cluster-info', '--request-timeout=3s'])
+
         all_found = True
-        for tool, version_cmd in tools:
-            returncode, _, _ = self.run_command(version_cmd.split(), capture_output=True)
-            if returncode == 0:
+        for tool, job in tool_jobs:
+            if job.result() == 0:
                 self.print_success(f"{tool} is installed")
             else:
                 self.print_error(f"{tool} is not installed")
                 all_found = False
+        if not all_found:
+            return EXIT_MISSING_TOOL
 
         # Check cluster connectivity
-        returncode, _, _ = self.run_command(['kubectl', 'cluster-info'], capture_output=True)
-        if returncode == 0:
+        if cluster_job.result() == 0:
             self.print_success("kubectl can connect to cluster")
         else:
             self.print_error("kubectl cannot connect to cluster")
-            all_found = False
+            return EXIT_NO_CLUSTER
 
-        return all_found
+        return EXIT_OK
 
     # ==================== Resource Listing ====================
 
@@ -203,22 +477,38 @@ class QuakeWatchCleanup:
             'Namespaces': []
         }
 
-        # Check ArgoCD application
-        if self.resource_exists('application', 'earthquake-app', 'argocd'):
-            resources['ArgoCD'].append("application/earthquake-app -n argocd")
-
-        # Check application resources in default namespace
-        returncode, stdout, _ = self.run_command([
+        # Run all probes concurrently. The bulk lists prime the cluster state cache
+        # (one list per namespace instead of one get per resource).
+        cache_jobs = [
+            self._pool.submit(self._get_many, namespace, kinds)
+            for namespace, kinds in [
+                ('argocd', ['application']),
+                ('default', ['servicemonitor']),
+                ('monitoring', ['prometheusrule', 'configmap']),
+                (None, ['namespace'])
+            ]
+        ]
+        app_job = self._pool.submit(self.run_command, [
             'kubectl', 'get', 'all,configmap,secret,pvc,serviceaccount,cronjob,servicemonitor',
             '-l', 'app.kubernetes.io/instance=earthquake-app',
             '-n', 'default',
             '-o', 'name'
         ])
+        helm_job = self._pool.submit(self.helm_release_exists, 'kube-prometheus-stack', 'monitoring')
+        for job in cache_jobs:
+            job.result()
+
+        # Check ArgoCD application
+        if self.resource_exists('application', 'earthquake-app', 'argocd'):
+            resources['ArgoCD'].append("application/earthquake-app -n argocd")
+
+        # Check application resources in default namespace
+        returncode, stdout, _ = app_job.result()
         if returncode == 0 and stdout.strip():
             resources['Application'].extend(stdout.strip().split('\n'))
 
         # Check Helm release
-        if self.helm_release_exists('kube-prometheus-stack', 'monitoring'):
+        if helm_job.result():
             resources['Monitoring Stack'].append("Helm release: kube-prometheus-stack")
 
         # Check monitoring resources
@@ -231,7 +521,7 @@ class QuakeWatchCleanup:
             if self.resource_exists(res_type, name, ns):
                 resources['Monitoring Resources'].append(f"{res_type}/{name} -n {ns}")
 
-        # Check namespaces
+        # Check namespaces (answers stay cached for the delete phases)
         for ns in ['argocd', 'monitoring']:
             if self.namespace_exists(ns):
                 resources['Namespaces'].append(f"namespace/{ns}")
@@ -265,15 +555,34 @@ class QuakeWatchCleanup:
         returncode, stdout, _ = self.run_command(['pgrep', '-f', 'kubectl port-forward'], capture_output=True)
 
         if returncode == 0 and stdout.strip():
-            pids = stdout.strip().split('\n')
+            pids = [int(pid) for pid in stdout.split()]
             self.print_info(f"Found {len(pids)} port-forward process(es)")
 
             if not self.dry_run:
-                self.run_command(['pkill', '-f', 'kubectl port-forward'])
+                # Signal the PIDs pgrep already found instead of rescanning /proc with pkill
+                self._signal_pids(pids, signal.SIGTERM)
+                time.sleep(0.5)
+                survivors = [pid for pid in pids if self._signal_pids([pid], 0)]
+                if survivors:
+                    self._signal_pids(survivors, signal.SIGKILL)
                 self.print_success("All port-forwards stopped")
         else:
             self.print_info("No port-forward processes running")
 
+    def _signal_pids(self, pids: List[int], sig: int) -> bool:
+        """Send a signal to each PID, return True if any of them is still alive"""
+        alive = False
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+                alive = True
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                if self.verbose:
+                    self.print_warning(f"No permission to signal process {pid}")
+        return alive
+
     def delete_argocd_application(self):
         """Delete ArgoCD application"""
         self.print_header("Removing ArgoCD Application")
@@ -305,38 +614,61 @@ class QuakeWatchCleanup:
         if returncode == 0:
             self.print_success("Application resources deleted")
             if stdout and self.verbose:
-                print(stdout)
+                self._emit(stdout)
         else:
             self.print_warning("Some application resources may not have been deleted")
 
-        # Also delete standalone ServiceMonitor
-        self.delete_resource('servicemonitor', 'quakewatch-app', 'default')
+        # Also delete standalone ServiceMonitor, waiting on finalizers while the operator still runs
+        self.delete_resource('servicemonitor', 'quakewatch-app', 'default', wait=True)
 
     def delete_monitoring_resources(self):
         """Delete standalone monitoring resources"""
         self.print_header("Removing Monitoring Resources")
 
-        # Delete using kubectl if files exist
+        # Manifest file, description, and the object to delete by name if the file is missing
         resources = [
-            ('monitoring/standalone/servicemonitor.yaml', 'ServiceMonitor'),
-            ('monitoring/standalone/prometheus-alerts.yaml', 'PrometheusRule'),
-            ('monitoring/standalone/grafana-dashboard.yaml', 'Grafana Dashboard')
+            ('monitoring/standalone/servicemonitor.yaml', 'ServiceMonitor',
+             ('servicemonitor', 'quakewatch-app', 'default')),
+            ('monitoring/standalone/prometheus-alerts.yaml', 'PrometheusRule',
+             ('prometheusrule', 'quakewatch-alerts', 'monitoring')),
+            ('monitoring/standalone/grafana-dashboard.yaml', 'Grafana Dashboard',
+             ('configmap', 'quakewatch-dashboard', 'monitoring'))
         ]
 
-        import os
-        for file_path, description in resources:
-            if os.path.exists(file_path):
-                returncode, _, _ = self.run_command(['kubectl', 'delete', '-f', file_path, '--ignore-not-found=true'])
-                if returncode == 0:
+        # Objects an earlier phase already deleted need no second round-trip
+        for _, description, key in resources:
+            if key in self._deleted_keys:
+                self.print_info(f"{description} already deleted")
+        resources = [r for r in resources if r[2] not in self._deleted_keys]
+
+        # Delete all remaining manifests that exist with a single kubectl call
+        present = [r for r in resources if os.path.isfile(r[0])]
+        # If that fails (e.g. the PrometheusRule CRD is already gone), retry file by file
+        # so one bad manifest does not hide the result of the others
+        batches = [present] if present else []
+        while batches:
+            batch = batches.pop()
+            cmd = ['kubectl', 'delete', '--ignore-not-found=true', '--wait=true', '--cascade=foreground']
+            for file_path, _, _ in batch:
+                cmd.extend(['-f', file_path])
+            returncode, _, stderr = self.run_command(cmd)
+            if returncode == 0:
+                for _, description, key in batch:
                     self.print_success(f"{description} deleted")
+                    self._forget(*key)
+                    self._deleted_keys.add(key)
+            elif len(batch) > 1:
+                self.print_warning("Batched manifest delete failed, retrying each file")
+                batches.extend([r] for r in reversed(batch))
             else:
-                # Try deleting by resource name
-                if 'servicemonitor' in file_path:
-                    self.delete_resource('servicemonitor', 'quakewatch-app', 'default')
-                elif 'prometheus-alerts' in file_path:
-                    self.delete_resource('prometheusrule', 'quakewatch-alerts', 'monitoring')
-                elif 'grafana-dashboard' in file_path:
-                    self.delete_resource('configmap', 'quakewatch-dashboard', 'monitoring')
+                self.print_warning(f"{batch[0][1]} may not have been deleted")
+                if stderr and self.verbose:
+                    self._emit(stderr)
+
+        # Try deleting by resource name
+        for file_path, _, (res_type, name, ns) in resources:
+            if not os.path.isfile(file_path):
+                self.delete_resource(res_type, name, ns, wait=(res_type == 'servicemonitor'))
 
     def delete_monitoring_stack(self):
         """Delete Prometheus & Grafana Helm release"""
@@ -345,12 +677,14 @@ class QuakeWatchCleanup:
         if self.helm_release_exists('kube-prometheus-stack', 'monitoring'):
             self.print_info("Uninstalling kube-prometheus-stack Helm release...")
 
-            cmd = ['helm', 'uninstall', 'kube-prometheus-stack', '-n', 'monitoring']
+            # --wait keeps the PVC and namespace cleanup from racing the release's own teardown
+            cmd = ['helm', 'uninstall', 'kube-prometheus-stack', '-n', 'monitoring', '--wait', '--timeout=300s']
             returncode, _, stderr = self.run_command(cmd)
 
             if returncode == 0:
                 self.print_success("Helm release uninstalled")
                 self.deleted_resources.append("helm-release/kube-prometheus-stack")
+                self._helm_releases['monitoring'].discard('kube-prometheus-stack')
             else:
                 self.print_error(f"Failed to uninstall Helm release: {stderr}")
         else:
@@ -365,16 +699,80 @@ class QuakeWatchCleanup:
         """Delete ArgoCD and monitoring namespaces"""
         self.print_header("Removing Namespaces")
 
+        # The namespaces are independent, so wait on both deletions in parallel
+        jobs = {}
         for namespace in ['argocd', 'monitoring']:
             if self.namespace_exists(namespace):
                 self.print_info(f"Deleting namespace '{namespace}' (this may take a moment)...")
-                if self.delete_namespace_wait(namespace, timeout=120):
-                    self.print_success(f"Namespace '{namespace}' deleted")
-                else:
-                    self.print_warning(f"Namespace '{namespace}' deletion timed out (may still be deleting in background)")
+                jobs[namespace] = self._submit(self.delete_namespace_wait, namespace, 120)
             else:
                 self.print_info(f"Namespace '{namespace}' not found")
 
+        wait(jobs.values())
+        for namespace, job in jobs.items():
+            if job.result():
+                self.print_success(f"Namespace '{namespace}' deleted")
+            else:
+                self.print_warning(f"Namespace '{namespace}' deletion timed out (may still be deleting in background)")
+
+    def _run_buffered(self, phase: Callable[[], None]):
+        """Run a phase with its output held back, then print it as one block so
+        concurrent phases do not interleave"""
+        self._out.lines = []
+        try:
+            phase()
+        finally:
+            lines, self._out.lines = self._out.lines, None
+            with self._out_lock:
+                print("\n".join(lines))
+
+    def _submit(self, fn: Callable, *args):
+        """Submit work to the pool; its output joins the calling phase's buffer"""
+        lines = getattr(self._out, 'lines', None)
+
+        def task():
+            self._out.lines = lines
+            try:
+                return fn(*args)
+            finally:
+                self._out.lines = None
+        return self._pool.submit(task)
+
+    def run_phases_parallel(self):
+        """Run the cleanup phases as a DAG, starting each one once its dependencies are done"""
+        phases = {
+            'ports': self.kill_port_forwards,
+            'argocd_app': self.delete_argocd_application,
+            'app_resources': self.delete_application_resources,
+            'monitoring_res': self.delete_monitoring_resources,
+            'monitoring_stack': self.delete_monitoring_stack,
+            'namespaces': self.delete_namespaces
+        }
+        # phase -> phases that must finish first (same reverse-dependency order as run())
+        graph = {
+            'ports': [],
+            'argocd_app': [],
+            # After the Application is gone, or ArgoCD self-heal recreates what the label delete removes
+            'app_resources': ['argocd_app'],
+            'monitoring_res': ['app_resources'],
+            'monitoring_stack': ['monitoring_res'],
+            'namespaces': ['argocd_app', 'monitoring_stack']
+        }
+
+        done = set()
+        running = {}
+        # Separate executor: phases themselves submit work to self._pool
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            while len(done) < len(phases):
+                for phase, deps in graph.items():
+                    if phase not in done and phase not in running.values() and all(d in done for d in deps):
+                        running[executor.submit(self._run_buffered, phases[phase])] = phase
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()
+                    done.add(running.pop(future))
+
     # ==================== Main Cleanup Flow ====================
 
     def run(self):
@@ -388,42 +786,51 @@ class QuakeWatchCleanup:
                 print()
 
             # Check prerequisites
-            if not self.check_prerequisites():
+            exit_code = self.check_prerequisites()
+            if exit_code != EXIT_OK:
                 self.print_error("Prerequisites check failed")
-                sys.exit(1)
-
-            # List resources
-            resources = self.list_resources_to_delete()
-
-            # If no resources, exit
-            if all(len(v) == 0 for v in resources.values()):
-                self.print_success("Nothing to clean up!")
-                return
+                sys.exit(exit_code)
 
-            # Confirm
-            if not self.dry_run:
-                print(f"{Colors.YELLOW}⚠️  This will DELETE all resources listed above{Colors.RESET}")
-                print(f"{Colors.GREEN}✅ Resources NOT deleted:{Colors.RESET}")
-                print("  • k3s service (will keep running)")
-                print("  • Prometheus Operator CRDs (shared cluster resources)")
-                print("  • metrics-server (may be used by other apps)")
-                print("  • kubectl config")
-                print("  • Helm repositories")
-                print()
+            if self.args.all and self.args.skip_listing:
+                # Automation fast path: every delete is --ignore-not-found, so absent resources are no-ops
+                self.print_info("Skipping resource listing (--all --skip-listing)")
+            else:
+                # List resources
+                resources = self.list_resources_to_delete()
 
-                if not self.confirm_action(f"{Colors.BOLD}Proceed with cleanup?{Colors.RESET}", default=False):
-                    self.print_info("Cleanup cancelled")
+                # If no resources, exit
+                if all(len(v) == 0 for v in resources.values()):
+                    self.print_success("Nothing to clean up!")
                     return
 
+                # Confirm
+                if not self.dry_run:
+                    print(f"{Colors.YELLOW}⚠️  This will DELETE all resources listed above{Colors.RESET}")
+                    print(f"{Colors.GREEN}✅ Resources NOT deleted:{Colors.RESET}")
+                    print("  • k3s service (will keep running)")
+                    print("  • Prometheus Operator CRDs (shared cluster resources)")
+                    print("  • metrics-server (may be used by other apps)")
+                    print("  • kubectl config")
+                    print("  • Helm repositories")
+                    print()
+
+                    if not self.confirm_action(f"{Colors.BOLD}Proceed with cleanup?{Colors.RESET}", default=False):
+                        self.print_info("Cleanup cancelled")
+                        return
+
             start_time = time.time()
 
-            # Execute cleanup in order
-            self.kill_port_forwards()
-            self.delete_argocd_application()
-            self.delete_application_resources()
-            self.delete_monitoring_resources()
-            self.delete_monitoring_stack()
-            self.delete_namespaces()
+            # Execute cleanup in reverse install order: CRD consumers (ServiceMonitor,
+            # PrometheusRule) go before the operator that serves them, namespaces last
+            if self.args.parallel:
+                self.run_phases_parallel()
+            else:
+                self.kill_port_forwards()
+                self.delete_argocd_application()
+                self.delete_application_resources()
+                self.delete_monitoring_resources()
+                self.delete_monitoring_stack()
+                self.delete_namespaces()
 
             elapsed = time.time() - start_time
 
@@ -449,13 +856,14 @@ class QuakeWatchCleanup:
         except KeyboardInterrupt:
             print()
             self.print_warning("Cleanup interrupted by user")
-            sys.exit(1)
+            sys.exit(EXIT_FAILURE)
         except Exception as e:
             self.print_error(f"Unexpected error: {e}")
             if self.verbose:
-                import traceback
                 traceback.print_exc()
-            sys.exit(1)
+            sys.exit(EXIT_FAILURE)
+        finally:
+            self._pool.shutdown(wait=False)
 
 
 def main():
@@ -470,8 +878,14 @@ def main():
                         help='Show what would be deleted without actually deleting')
     parser.add_argument('--verbose', action='store_true',
                         help='Show detailed output including all commands')
+    parser.add_argument('--skip-listing', action='store_true',
+                        help='With --all, skip the resource listing and go straight to deletion')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run independent cleanup phases concurrently')
 
     args = parser.parse_args()
+    if args.skip_listing and not args.all:
+        parser.error('--skip-listing requires --all')
 
     cleanup = QuakeWatchCleanup(args)
     cleanup.run()
@@ -2,247 +2,604 @@
 """
 Helm Deployment Test Suite for QuakeWatch
 Tests Helm chart deployment and validates application functionality
+
+Progress is shown with icons on a terminal; when stdout is not a TTY (CI, pytest
+capture) each event is logged as a JSON line on the "helm-test" logger instead.
 """
 
 import subprocess
 import time
-import json
 import sys
 import os
+import shutil
+import random
+import threading
+import collections
+import json
+import logging
 import requests
-import pytest
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
+from kubernetes.stream import stream
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ReadTimeoutError, SSLError
+
+
+# Present when the tests run inside a Pod
+SERVICE_ACCOUNT_TOKEN = "/var/run/secrets/kubernetes.io/serviceaccount/token"
+
+# Probed by test_application_health; the first one doubles as the canary
+HEALTH_ENDPOINTS = ["/ping", "/health", "/status", "/"]
+
+# API server replies worth retrying on a read: throttling and an unavailable/overloaded control plane
+TRANSIENT_STATUSES = {429, 502, 503, 504}
+# Transport failures worth retrying: refused/unreachable connection, read timeout, TLS handshake.
+# The client's urllib3 pool wraps every transport failure in MaxRetryError, so these are
+# matched against its reason; anything else (ProtocolError, DecodeError, ...) is not retried
+TRANSIENT_TRANSPORT_ERRORS = (NewConnectionError, ReadTimeoutError, SSLError)
+
+# Progress icons are only rendered on an interactive terminal. Otherwise every event is
+# logged as one JSON line on the "helm-test" logger, so CI can parse per-stage timings
+INTERACTIVE = sys.stdout.isatty()
+ICONS = {"start": "🔹", "ok": "✅", "warn": "⚠️", "wait": "⏳", "error": "❌",
+         "suite": "🚀", "cleanup": "🧹"}
+log = logging.getLogger("helm-test")
+log.setLevel(logging.INFO)
+_stage = threading.local()
+LOG_LEVELS = {"error": logging.ERROR, "warn": logging.WARNING}
+
+
+def report(status: str, message: str, stage: Optional[str] = None,
+           detail: Optional[str] = None, **fields):
+    """Emit a progress event: an icon line on a TTY, a JSON log record otherwise.
+    Passing stage starts a new stage for the calling thread. detail is only printed on
+    a TTY; JSON records carry the same data in fields instead"""
+    now = time.time()
+    if stage is not None:
+        _stage.name, _stage.started = stage, now
+    if INTERACTIVE:
+        print(f"{ICONS[status]} {message}")
+        if detail:
+            print(detail)
+        return
+    record = {"ts": round(now, 3), "stage": getattr(_stage, "name", None), "status": status,
+              "message": message}
+    if hasattr(_stage, "started"):
+        record["elapsed"] = round(now - _stage.started, 3)
+    record.update(fields)
+    # Errors and warnings stay visible without a configured handler and at --log-level=WARNING
+    log.log(LOG_LEVELS.get(status, logging.INFO), json.dumps(record, default=str))
+
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 5.0) -> float:
+    """Exponential backoff delay for a retry attempt, capped and with ±20% jitter"""
+    delay = min(base * 2 ** attempt, cap)
+    return delay * (0.8 + random.random() * 0.4)
+
+
+class Deadline:
+    """Shared time budget: every call gets at most what is left of it"""
+
+    def __init__(self, seconds: float):
+        self.end = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never below 0.1 so calls fail fast instead of blocking"""
+        return max(0.1, self.end - time.monotonic())
+
+    def remaining_seconds(self) -> int:
+        """Whole seconds left, for watch timeouts (0 would mean no timeout)"""
+        return max(1, int(self.remaining()))
+
+
+class CircuitBreaker:
+    """Per-host breaker: CLOSED -> OPEN after consecutive connection failures -> HALF_OPEN trial"""
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: int = 2, reset_after: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go through; an OPEN breaker lets one trial through after reset_after"""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_after:
+                self.state = self.HALF_OPEN
+            return self.state != self.OPEN
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def trip(self):
+        """Open immediately, regardless of the failure count"""
+        with self._lock:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+
+def pod_ready(pod: client.V1Pod) -> bool:
+    """True if the pod is Running and its Ready condition is True"""
+    if pod.status.phase != "Running":
+        return False
+    return any(c.type == "Ready" and c.status == "True" for c in (pod.status.conditions or []))
+
+
+def rollout_complete(deployment: client.V1Deployment) -> bool:
+    """True once the controller has observed the latest spec and every replica is an
+    updated, available pod with no old ones left (the checks kubectl rollout status makes)"""
+    status = deployment.status
+    replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 1
+    return ((status.observed_generation or 0) >= (deployment.metadata.generation or 0)
+            and (status.updated_replicas or 0) == replicas
+            and (status.replicas or 0) == replicas
+            and (status.available_replicas or 0) == replicas)
 
 
 class HelmDeploymentTest:
-    def __init__(self, release_name: str = "quakewatch-test", namespace: str = "default"):
+    def __init__(self, release_name: str = "quakewatch-test", namespace: str = "default",
+                 verbose: bool = False):
         self.release_name = release_name
         self.namespace = namespace
+        self.verbose = verbose  # echo helm output live while it streams
         self.helm_chart_path = "quackwatch-helm/"
         self.timeout = 300  # 5 minutes
+        # End-to-end budget for the whole suite, shared by every subprocess, HTTP and API call
+        self.deadline = Deadline(self.timeout)
+        # The chart labels every object with the release name
+        self.label_selector = f"app.kubernetes.io/instance={release_name}"
+        self._pods: List[client.V1Pod] = []
+        self._pod_name: Optional[str] = None
+        self._port_forward: Optional[subprocess.Popen] = None
 
-    def run_command(self, cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
-        """Execute shell command and return result"""
+        # Resolve the CLI binaries once; kubectl is only needed for the port-forward outside the cluster
+        required = ["helm"] if os.path.exists(SERVICE_ACCOUNT_TOKEN) else ["helm", "kubectl"]
+        self._bins: Dict[str, Optional[str]] = {b: shutil.which(b) for b in ("helm", "kubectl")}
+        missing = [b for b in required if not self._bins[b]]
+        if missing:
+            raise RuntimeError(f"Required tools not found on PATH: {', '.join(missing)}")
+
+        # Read paths use the Kubernetes API over one shared connection instead of forking kubectl
+        if os.path.exists(SERVICE_ACCOUNT_TOKEN):
+            config.load_incluster_config()
+        else:
+            config.load_kube_config()
+        api_client = client.ApiClient()
+        self.apps = client.AppsV1Api(api_client)
+        self.core = client.CoreV1Api(api_client)
+        self.autoscaling = client.AutoscalingV1Api(api_client)
+
+        # Keep-alive connection pool for the health probes, one socket per concurrent probe.
+        # The app is served over HTTP/1.1, so connection reuse is what saves the handshakes
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1,
+                                                  pool_maxsize=len(HEALTH_ENDPOINTS) - 1))
+        # Stops probing the app once it is clearly unreachable
+        self.breaker = CircuitBreaker(failure_threshold=2)
+
+    def _resolve(self, cmd: List[str]) -> List[str]:
+        """cmd with its binary replaced by the path resolved at startup"""
+        return [self._bins.get(cmd[0]) or cmd[0]] + cmd[1:]
+
+    def run_command(self, cmd: List[str], check: bool = True,
+                    timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Execute shell command and return result (bounded by the suite deadline by default)"""
+        if timeout is None:
+            timeout = self.deadline.remaining()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=check)
+            result = subprocess.run(self._resolve(cmd), capture_output=True, text=True, check=check, timeout=timeout)
             return result
         except subprocess.CalledProcessError as e:
-            print(f"Command failed: {' '.join(cmd)}")
-            print(f"Return code: {e.returncode}")
-            print(f"STDOUT: {e.stdout}")
-            print(f"STDERR: {e.stderr}")
+            report("error", f"Command failed: {' '.join(cmd)}",
+                   detail=f"Return code: {e.returncode}\nSTDOUT: {e.stdout}\nSTDERR: {e.stderr}",
+                   cmd=cmd, returncode=e.returncode, stdout=e.stdout, stderr=e.stderr)
             raise
 
+    def run_command_streaming(self, cmd: List[str], timeout: Optional[float] = None,
+                              tail_lines: int = 200) -> subprocess.CompletedProcess:
+        """Execute a long-running command, reading its output line by line.
+        Only the last tail_lines lines are kept for the result and error report"""
+        if timeout is None:
+            timeout = self.deadline.remaining()
+        tail: collections.deque = collections.deque(maxlen=tail_lines)
+        process = subprocess.Popen(self._resolve(cmd), stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1)
+        # Kill from a timer so a hung command cannot block the line loop past the deadline
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            process.kill()
+        
+        killer = threading.Timer(timeout, kill)
+        killer.start()
+        try:
+            for line in process.stdout:
+                tail.append(line)
+                if self.verbose:
+                    # Keep stdout a pure JSON event stream when it is not a terminal
+                    (sys.stdout if INTERACTIVE else sys.stderr).write(line)
+            returncode = process.wait()
+        finally:
+            killer.cancel()
+            process.stdout.close()
+        
+        output = "".join(tail)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+        if returncode != 0:
+            report("error", f"Command failed: {' '.join(cmd)}",
+                   detail=f"Return code: {returncode}\nOUTPUT (last {tail_lines} lines): {output}",
+                   cmd=cmd, returncode=returncode, output=output)
+            raise subprocess.CalledProcessError(returncode, cmd, output=output)
+        return subprocess.CompletedProcess(cmd, returncode, stdout=output, stderr="")
+
+    def read_api(self, list_fn: Callable, *args, attempts: int = 3, **kwargs):
+        """Call a read-only API list function, retrying only transient failures
+        (throttling, 5xx from an overloaded API server, refused or timed-out connections,
+        TLS errors). Three attempts sleep twice, about 100ms then 200ms"""
+        for attempt in range(attempts):
+            try:
+                return list_fn(*args, _request_timeout=self.deadline.remaining(), **kwargs)
+            except ApiException as e:
+                if e.status not in TRANSIENT_STATUSES or attempt == attempts - 1:
+                    raise
+                report("wait", f"API returned {e.status}, retrying...", http_status=e.status)
+            except MaxRetryError as e:
+                if not isinstance(e.reason, TRANSIENT_TRANSPORT_ERRORS) or attempt == attempts - 1:
+                    raise
+                report("wait", f"API connection failed ({type(e.reason).__name__}), retrying...")
+            time.sleep(min(backoff_delay(attempt), self.deadline.remaining()))
+
+    def first_pod_name(self) -> Optional[str]:
+        """Name of the first release pod. test_pods_running fills the cache; the lookup
+        only runs when a test method is invoked on its own"""
+        if self._pod_name is None:
+            # Only one name is needed, so let the API server stop after the first match
+            pods = self.read_api(self.core.list_namespaced_pod, self.namespace,
+                                 label_selector=self.label_selector, limit=1)
+            if pods.items:
+                self._pod_name = pods.items[0].metadata.name
+        return self._pod_name
+
+    def probe_endpoint(self, url: str):
+        """GET url over the pooled session; returns the response, the request error,
+        or None when the circuit breaker is open"""
+        if not self.breaker.allow():
+            return None
+        try:
+            response = self.session.get(url, timeout=min(10, self.deadline.remaining()))
+        except (requests.ConnectionError, requests.Timeout) as e:
+            self.breaker.record_failure()
+            return e
+        except requests.RequestException as e:
+            return e
+        self.breaker.record_success()
+        return response
+
+    def exec_in_pod(self, pod_name: str, command: List[str]) -> int:
+        """Run command in a pod over the API exec stream and return its exit code"""
+        try:
+            resp = stream(self.core.connect_get_namespaced_pod_exec, pod_name, self.namespace,
+                          command=command, stderr=True, stdin=False, stdout=True, tty=False,
+                          _preload_content=False)
+        except ApiException as e:
+            report("error", f"Exec failed: {e.reason}")
+            return 1
+        resp.run_forever(timeout=min(30, self.deadline.remaining()))
+        returncode = resp.returncode
+        resp.close()
+        return returncode
+
+    def helm_supports_server_side(self) -> bool:
+        """Whether the helm binary takes --server-side (Helm 4 and later)"""
+        result = self.run_command(["helm", "version", "--short"], check=False, timeout=10)
+        version = result.stdout.strip().lstrip("v")
+        try:
+            return result.returncode == 0 and int(version.split(".")[0]) >= 4
+        except ValueError:
+            return False
+
+    def app_base_url(self, pod_name: str) -> str:
+        """Base URL of the application. Outside the cluster this opens one background
+        port-forward on first use and keeps it for the rest of the suite"""
+        if os.path.exists(SERVICE_ACCOUNT_TOKEN):
+            # Running in the cluster: talk to the release's Service directly, no port-forward needed.
+            # Its name comes from the chart's fullname template, so look it up by label
+            services = self.read_api(self.core.list_namespaced_service, self.namespace,
+                                     label_selector=self.label_selector, limit=1)
+            assert services.items, "Service not found"
+            service = services.items[0]
+            return (f"http://{service.metadata.name}.{self.namespace}.svc.cluster.local:"
+                    f"{service.spec.ports[0].port}")
+        
+        base_url = "http://localhost:8080"
+        if self._port_forward is not None and self._port_forward.poll() is None:
+            return base_url
+        
+        port_forward_cmd = ["kubectl", "port-forward", pod_name, "8080:5000", "-n", self.namespace]
+        self._port_forward = subprocess.Popen(self._resolve(port_forward_cmd),
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        # Wait for port forward to be ready: retry /ping with backoff for up to 3s
+        # instead of a flat 3s sleep
+        ready_by = time.monotonic() + min(3, self.deadline.remaining())
+        attempt = 0
+        while time.monotonic() < ready_by and self._port_forward.poll() is None:
+            try:
+                self.session.get(f"{base_url}/ping", timeout=min(1, self.deadline.remaining()))
+                return base_url
+            except requests.RequestException:
+                time.sleep(min(backoff_delay(attempt), max(0, ready_by - time.monotonic())))
+                attempt += 1
+        # A forward that never answered counts as one failure for the breaker
+        self.breaker.record_failure()
+        return base_url
+
+    def stop_port_forward(self):
+        """Terminate the shared port-forward, if one was started"""
+        if self._port_forward is not None:
+            self._port_forward.terminate()
+            self._port_forward.wait()
+            self._port_forward = None
+
     def test_helm_install(self):
         """Test Helm chart installation"""
-        print("🔹 Installing Helm chart...")
+        report("start", "Installing Helm chart...", stage="install")
         
-        # Install or upgrade Helm release
+        # Install or upgrade Helm release. No --wait: test_pods_running is the single readiness gate
         cmd = [
             "helm", "upgrade", "--install", self.release_name, 
             self.helm_chart_path,
             "--namespace", self.namespace,
-            "--create-namespace",
-            "--wait", "--timeout=5m"
+            "--create-namespace"
         ]
+        # Let the API server do the apply merge; Helm 3 keeps the client-side path
+        if self.helm_supports_server_side():
+            cmd += ["--server-side=true", "--force-conflicts"]
         
-        result = self.run_command(cmd)
-        assert result.returncode == 0, f"Helm install failed: {result.stderr}"
-        print("✅ Helm chart installed successfully")
+        # Streamed: helm output is read as it arrives instead of buffered for the whole install
+        result = self.run_command_streaming(cmd)
+        assert result.returncode == 0, f"Helm install failed: {result.stdout}"
+        report("ok", "Helm chart installed successfully")
+
+    def wait_for_rollout(self, timeout_seconds: Optional[int] = None) -> client.V1Deployment:
+        """Watch the release's Deployment until the current revision is fully rolled out.
+        Without helm --wait this is what keeps an upgrade from passing on the old pods"""
+        # Selected by the release label like every other read
+        deployments = self.read_api(self.apps.list_namespaced_deployment, self.namespace,
+                                    label_selector=self.label_selector)
+        assert deployments.items, "Deployment not found"
+        deployment = deployments.items[0]
+        
+        if not rollout_complete(deployment):
+            w = watch.Watch()
+            for event in w.stream(self.apps.list_namespaced_deployment, self.namespace,
+                                  label_selector=self.label_selector,
+                                  resource_version=deployments.metadata.resource_version,
+                                  timeout_seconds=timeout_seconds or self.deadline.remaining_seconds()):
+                deployment = event["object"]
+                if rollout_complete(deployment):
+                    w.stop()
+        return deployment
 
     def test_deployment_status(self):
         """Test deployment status and readiness"""
-        print("🔹 Checking deployment status...")
-        
-        # Get deployment status - deployment name is always quackwatch-helm
-        cmd = ["kubectl", "get", "deployment", "quackwatch-helm", 
-               "-n", self.namespace, "-o", "json"]
-        result = self.run_command(cmd)
+        report("start", "Checking deployment status...", stage="deployment")
         
-        deployment = json.loads(result.stdout)
+        deployment = self.wait_for_rollout(timeout_seconds=min(60, self.deadline.remaining_seconds()))
         
-        # Check deployment exists and has desired replicas
-        assert deployment["status"]["replicas"] > 0, "No replicas found"
-        assert deployment["status"]["readyReplicas"] == deployment["status"]["replicas"], \
-            "Not all replicas are ready"
+        # Check deployment exists and has desired replicas of the current revision
+        assert (deployment.status.replicas or 0) > 0, "No replicas found"
+        assert rollout_complete(deployment), \
+            (f"Rollout incomplete: {deployment.status.updated_replicas or 0} updated, "
+             f"{deployment.status.ready_replicas or 0} ready of {deployment.status.replicas} replicas")
         
-        print(f"✅ Deployment has {deployment['status']['readyReplicas']} ready replicas")
+        report("ok", f"Deployment has {deployment.status.ready_replicas} ready replicas")
 
     def test_pods_running(self):
         """Test that pods are running and healthy"""
-        print("🔹 Checking pod status...")
-        
-        # Wait for pods to be running
-        max_attempts = 30
-        for attempt in range(max_attempts):
-            cmd = ["kubectl", "get", "pods", "-l", "app.kubernetes.io/instance=quackwatch-helm",
-                   "-n", self.namespace, "-o", "json"]
-            result = self.run_command(cmd)
-            pods = json.loads(result.stdout)
-            
-            if not pods["items"]:
-                time.sleep(2)
-                continue
-                
-            all_running = True
-            for pod in pods["items"]:
-                if pod["status"]["phase"] != "Running":
-                    all_running = False
-                    break
+        report("start", "Checking pod status...", stage="pods")
+        
+        # Right after helm upgrade returns the new ReplicaSet may not exist yet, and the old
+        # pods are still Ready: wait for the rollout before judging the pods
+        if not rollout_complete(self.wait_for_rollout()):
+            raise AssertionError("Deployment rollout did not complete within timeout")
+        
+        # Start from a full list, then watch for changes from its resourceVersion, so the
+        # check is made against every pod rather than the first synthetic ADDED events.
+        # Terminating pods from a previous revision are ignored.
+        pod_list = self.read_api(self.core.list_namespaced_pod, self.namespace,
+                                 label_selector=self.label_selector)
+        pods: Dict[str, client.V1Pod] = {pod.metadata.name: pod for pod in pod_list.items
+                                         if pod.metadata.deletion_timestamp is None}
+        
+        if pods and all(pod_ready(pod) for pod in pods.values()):
+            report("ok", f"All {len(pods)} pods are running and ready")
+            return self._remember_pods(pods)
+        
+        w = watch.Watch()
+        for event in w.stream(self.core.list_namespaced_pod, self.namespace,
+                              label_selector=self.label_selector,
+                              resource_version=pod_list.metadata.resource_version,
+                              timeout_seconds=self.deadline.remaining_seconds()):
+            pod = event["object"]
+            if event["type"] == "DELETED" or pod.metadata.deletion_timestamp is not None:
+                pods.pop(pod.metadata.name, None)
+            else:
+                pods[pod.metadata.name] = pod
             
-            if all_running:
-                print(f"✅ All {len(pods['items'])} pods are running")
-                return pods["items"]
+            ready = sum(1 for p in pods.values() if pod_ready(p))
+            if pods and ready == len(pods):
+                w.stop()
+                report("ok", f"All {len(pods)} pods are running and ready")
+                return self._remember_pods(pods)
             
-            print(f"⏳ Waiting for pods to be ready... (attempt {attempt + 1}/{max_attempts})")
-            time.sleep(2)
+            report("wait", f"Waiting for pods to be ready... ({ready}/{len(pods)} ready)")
         
-        raise AssertionError("Pods did not reach Running state within timeout")
+        raise AssertionError("Pods did not become Running and Ready within timeout")
+
+    def _remember_pods(self, pods: Dict[str, client.V1Pod]) -> List[client.V1Pod]:
+        """Keep the ready pods on self so later tests skip their own pod lookup"""
+        self._pods = list(pods.values())
+        self._pod_name = self._pods[0].metadata.name
+        return self._pods
 
     def test_service_exists(self):
         """Test that service is created and accessible"""
-        print("🔹 Checking service...")
+        report("start", "Checking service...", stage="service")
         
-        cmd = ["kubectl", "get", "service", "quackwatch-helm",
-               "-n", self.namespace, "-o", "json"]
-        result = self.run_command(cmd)
+        services = self.read_api(self.core.list_namespaced_service, self.namespace,
+                                 label_selector=self.label_selector, limit=1)
+        assert services.items, "Service not found"
+        service = services.items[0]
+        assert service.spec.ports, "Service has no ports defined"
         
-        service = json.loads(result.stdout)
-        assert service["spec"]["ports"], "Service has no ports defined"
-        
-        print(f"✅ Service exists with {len(service['spec']['ports'])} ports")
+        report("ok", f"Service exists with {len(service.spec.ports)} ports")
         return service
 
     def test_configmap_mount(self):
         """Test ConfigMap is properly mounted"""
-        print("🔹 Verifying ConfigMap mount...")
+        report("start", "Verifying ConfigMap mount...", stage="configmap")
         
         # Get first pod
-        cmd = ["kubectl", "get", "pods", "-l", "app.kubernetes.io/instance=quackwatch-helm",
-               "-n", self.namespace, "-o", "jsonpath={.items[0].metadata.name}"]
-        result = self.run_command(cmd)
-        pod_name = result.stdout.strip()
+        pod_name = self.first_pod_name()
         
         if not pod_name:
             raise AssertionError("No pods found for ConfigMap test")
         
-        # Check if config directory exists
-        cmd = ["kubectl", "exec", pod_name, "-n", self.namespace, "--", "ls", "/data"]
-        result = self.run_command(cmd, check=False)
-        
-        if result.returncode == 0:
-            print("✅ ConfigMap mounted successfully")
+        # Check the config directory and file in one exec stream:
+        # exit 2 means no mount directory, exit 3 means the file is missing
+        returncode = self.exec_in_pod(pod_name, [
+            "sh", "-c",
+            "ls /data >/dev/null 2>&1 || exit 2; cat /data/earthquake.conf >/dev/null 2>&1 || exit 3"
+        ])
+        if returncode in (0, 3):
+            report("ok", "ConfigMap mounted successfully")
             
-            # Try to read config file
-            cmd = ["kubectl", "exec", pod_name, "-n", self.namespace, "--", "cat", "/data/earthquake.conf"]
-            config_result = self.run_command(cmd, check=False)
-            if config_result.returncode == 0:
-                print("✅ Configuration file accessible")
+            if returncode == 0:
+                report("ok", "Configuration file accessible")
             else:
-                print("⚠️ Configuration file not found, but mount exists")
+                report("warn", "Configuration file not found, but mount exists")
         else:
-            print("⚠️ ConfigMap mount directory not found")
+            report("warn", "ConfigMap mount directory not found")
 
     def test_application_health(self):
         """Test application health endpoints"""
-        print("🔹 Testing application health...")
+        report("start", "Testing application health...", stage="health")
         
         # Get pod name
-        cmd = ["kubectl", "get", "pods", "-l", "app.kubernetes.io/instance=quackwatch-helm",
-               "-n", self.namespace, "-o", "jsonpath={.items[0].metadata.name}"]
-        result = self.run_command(cmd)
-        pod_name = result.stdout.strip()
+        pod_name = self.first_pod_name()
         
         if not pod_name:
             raise AssertionError("No pods found for health test")
         
-        # Port forward in background
-        port_forward_cmd = ["kubectl", "port-forward", pod_name, "8080:5000", "-n", self.namespace]
-        port_forward_process = subprocess.Popen(port_forward_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        base_url = self.app_base_url(pod_name)
         
-        try:
-            # Wait for port forward to be ready
-            time.sleep(3)
-            
-            # Test health endpoints
-            health_endpoints = ["/ping", "/health", "/status"]
-            for endpoint in health_endpoints:
-                try:
-                    response = requests.get(f"http://localhost:8080{endpoint}", timeout=10)
-                    if response.status_code == 200:
-                        print(f"✅ Health endpoint {endpoint} responding")
-                    else:
-                        print(f"⚠️ Health endpoint {endpoint} returned {response.status_code}")
-                except requests.RequestException as e:
-                    print(f"⚠️ Health endpoint {endpoint} failed: {e}")
-            
-            # Test main application endpoint
-            try:
-                response = requests.get("http://localhost:8080/", timeout=10)
-                if response.status_code == 200:
-                    print("✅ Main application endpoint responding")
-                else:
-                    print(f"⚠️ Main endpoint returned {response.status_code}")
-            except requests.RequestException as e:
-                print(f"⚠️ Main application endpoint failed: {e}")
-                
-        finally:
-            # Clean up port forward
-            port_forward_process.terminate()
-            port_forward_process.wait()
+        # /ping first as a canary, then the remaining endpoints in parallel
+        endpoints = HEALTH_ENDPOINTS
+        results = [self.probe_endpoint(f"{base_url}{endpoints[0]}")]
+        if isinstance(results[0], (requests.ConnectionError, requests.Timeout)):
+            # A dead canary means the concurrent probes would only wait out their timeouts too
+            self.breaker.trip()
+        with ThreadPoolExecutor(max_workers=len(endpoints) - 1) as executor:
+            results += list(executor.map(self.probe_endpoint, [f"{base_url}{e}" for e in endpoints[1:]]))
+        
+        for endpoint, result in zip(endpoints, results):
+            label = "Main application endpoint" if endpoint == "/" else f"Health endpoint {endpoint}"
+            if result is None:
+                report("warn", f"{label} skipped (circuit open)")
+            elif isinstance(result, requests.RequestException):
+                report("warn", f"{label} failed: {result}")
+            elif result.status_code == 200:
+                report("ok", f"{label} responding")
+            else:
+                report("warn", f"{label} returned {result.status_code}")
+        
+        if self.breaker.is_open:
+            raise AssertionError(f"Application at {base_url} is unreachable (circuit open)")
 
     def test_hpa_exists(self):
         """Test Horizontal Pod Autoscaler exists"""
-        print("🔹 Checking HPA...")
+        report("start", "Checking HPA...", stage="hpa")
         
-        cmd = ["kubectl", "get", "hpa", "quackwatch-helm",
-               "-n", self.namespace, "-o", "json"]
-        result = self.run_command(cmd, check=False)
+        hpas = self.read_api(self.autoscaling.list_namespaced_horizontal_pod_autoscaler, self.namespace,
+                             label_selector=self.label_selector, limit=1)
         
-        if result.returncode == 0:
-            hpa = json.loads(result.stdout)
-            min_replicas = hpa["spec"]["minReplicas"]
-            max_replicas = hpa["spec"]["maxReplicas"]
-            print(f"✅ HPA configured: {min_replicas}-{max_replicas} replicas")
+        if hpas.items:
+            min_replicas = hpas.items[0].spec.min_replicas
+            max_replicas = hpas.items[0].spec.max_replicas
+            report("ok", f"HPA configured: {min_replicas}-{max_replicas} replicas")
         else:
-            print("⚠️ HPA not found or not configured")
+            report("warn", "HPA not found or not configured")
 
     def cleanup(self):
         """Clean up test deployment"""
-        print("🧹 Cleaning up test deployment...")
+        report("cleanup", "Cleaning up test deployment...", stage="cleanup")
         
         cmd = ["helm", "uninstall", self.release_name, "-n", self.namespace]
-        result = self.run_command(cmd, check=False)
+        # Cleanup gets its own timeout so it still runs after the test budget is spent
+        result = self.run_command(cmd, check=False, timeout=120)
         
         if result.returncode == 0:
-            print("✅ Test deployment cleaned up")
+            report("ok", "Test deployment cleaned up")
         else:
-            print("⚠️ Cleanup may have failed, check manually")
+            report("warn", "Cleanup may have failed, check manually")
 
     def run_all_tests(self):
         """Run complete test suite"""
-        print("🚀 Starting Helm Deployment Test Suite")
-        print("=" * 50)
+        started = time.time()
+        report("suite", "Starting Helm Deployment Test Suite", stage="suite")
+        if INTERACTIVE:
+            print("=" * 50)
         
         try:
             self.test_helm_install()
-            self.test_deployment_status()
             pods = self.test_pods_running()
-            self.test_service_exists()
+            
+            # Independent read-only checks, issued concurrently against the API server
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                checks = [executor.submit(self.test_deployment_status),
+                          executor.submit(self.test_service_exists),
+                          executor.submit(self.test_hpa_exists)]
+                for check in as_completed(checks):
+                    check.result()
+            
             self.test_configmap_mount()
             self.test_application_health()
-            self.test_hpa_exists()
             
-            print("=" * 50)
-            print("✅ All tests completed successfully!")
+            if INTERACTIVE:
+                print("=" * 50)
+            report("ok", "All tests completed successfully!", stage="suite",
+                   elapsed=round(time.time() - started, 3))
             return True
             
         except Exception as e:
-            print("=" * 50)
-            print(f"❌ Test failed: {e}")
+            if INTERACTIVE:
+                print("=" * 50)
+            report("error", f"Test failed: {e}", stage="suite", elapsed=round(time.time() - started, 3))
             return False
         
         finally:
+            self.stop_port_forward()
             if os.getenv("CLEANUP", "true").lower() == "true":
                 self.cleanup()
 
@@ -255,13 +612,18 @@ def main():
     parser.add_argument("--release-name", default="quakewatch-test", help="Helm release name")
     parser.add_argument("--namespace", default="default", help="Kubernetes namespace")
     parser.add_argument("--no-cleanup", action="store_true", help="Skip cleanup after tests")
+    parser.add_argument("--verbose", action="store_true", help="Show helm output as it runs")
     
     args = parser.parse_args()
     
+    if not INTERACTIVE:
+        # One JSON event per line on stdout
+        logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    
     if args.no_cleanup:
         os.environ["CLEANUP"] = "false"
     
-    test_suite = HelmDeploymentTest(args.release_name, args.namespace)
+    test_suite = HelmDeploymentTest(args.release_name, args.namespace, verbose=args.verbose)
     success = test_suite.run_all_tests()
     
     sys.exit(0 if success else 1)
@@ -277,18 +639,19 @@ class TestHelmDeployment:
     
     @classmethod
     def teardown_class(cls):
+        cls.test_suite.stop_port_forward()
         if os.getenv("CLEANUP", "true").lower() == "true":
             cls.test_suite.cleanup()
     
     def test_helm_install(self):
         self.test_suite.test_helm_install()
     
-    def test_deployment_status(self):
-        self.test_suite.test_deployment_status()
-    
     def test_pods_running(self):
         self.test_suite.test_pods_running()
     
+    def test_deployment_status(self):
+        self.test_suite.test_deployment_status()
+    
     def test_service_exists(self):
         self.test_suite.test_service_exists()
     